@@ -1,17 +1,24 @@
-import asyncio
 import datetime
 from sqlalchemy import select, insert, update
+from sqlalchemy.dialects.postgresql import insert as upsert
 from .conn import conn
 from .tables import games_table
 
 
 async def register_games(all_games):
     """
-    all_games should be a dict of slug -> values
+    all_games should be a dict of slug -> values, all with the same keys.
+    Creates or updates every game in a single round trip.
     """
-    await asyncio.gather(
-        *[create_or_update_game(slug, values) for slug, values in all_games.items()]
+    if not all_games:
+        return
+    rows = [{"slug": slug, **values} for slug, values in all_games.items()]
+    query = upsert(games_table).values(rows)
+    query = query.on_conflict_do_update(
+        index_elements=[games_table.c.slug],
+        set_={key: query.excluded[key] for key in rows[0] if key != "slug"},
     )
+    await conn.execute(query=query)
 
 
 async def create_or_update_game(slug, values):
@@ -13,9 +13,11 @@ app.add_game(Hangman)
 
 if __name__ == "__main__":
     debug = os.environ.get('DEBUG', False)
+    workers = int(os.environ.get('WORKERS', 1))
 
     app.start(
         host="0.0.0.0",
         port=3000,
-        debug=debug
+        debug=debug,
+        workers=workers
     )
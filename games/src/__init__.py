@@ -1,3 +1,11 @@
-import uvloop
+import sys
 
-uvloop.install()
+# libuv backed event loop for all of the server's socket io,
+# the stock asyncio loop is used where uvloop isn't available
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
@@ -6,12 +6,14 @@ import termninja_db as db
 from slugify import slugify
 from abc import ABCMeta, abstractmethod
 from . import cursor
+from .ring import RingQueue
 from .messages import (
     GENERIC_QUIZ_INITIAL_QUESTION,
     GENERIC_QUIZ_PROGRESS_UPDATE,
     GENERIC_QUIZ_CLEAR_ENTRY,
     GENERIC_QUIZ_INTERMISSION_REPORT,
     SUPPORTS_EMOJIS_PROMPT,
+    CLEAR_SCREEN,
 )
 
 
@@ -101,27 +103,56 @@ class Game(metaclass=ABCMeta):
 
     @classmethod
     async def player_connected(cls, player):
-        if not hasattr(cls, "__queue"):
-            await cls._initialize()
+        if "_Game__running" not in cls.__dict__:
+            cls._initialize()
         await cls.on_player_connected(player)
-        await cls.__queue.put(player)
+        if cls.player_count == 1:
+            # nobody to wait for, start right away
+            cls._launch(player)
+        else:
+            await cls.__queue.put(player)
 
     @classmethod
     async def on_player_connected(cls, player):
-        await player.send(f"{cursor.CLEAR}" f"{cursor.PAGE_DOWN}" f"{cursor.down(50)}")
+        await player.send(CLEAR_SCREEN)
 
     @classmethod
-    async def _initialize(cls):
+    def _initialize(cls):
         cls.__loop = asyncio.get_running_loop()
-        cls.__queue = asyncio.Queue()
-        asyncio.create_task(cls._launcher())
+        # the loop only keeps weak references to tasks
+        cls.__running = set()
+        if cls.player_count > 1:
+            # bounded so waiting players apply backpressure instead
+            # of piling up without limit
+            cls.__queue = RingQueue(maxsize=max(8, cls.player_count * 4))
+            cls.__launcher = asyncio.create_task(cls._launcher())
 
     @classmethod
     async def _launcher(cls):
         while True:
             players = [await cls.__queue.get() for _ in range(cls.player_count)]
-            instance = cls(*players)
-            asyncio.create_task(instance._start())
+            cls._launch(*players)
+
+    @classmethod
+    async def cancel_running(cls):
+        """
+        Cancel the launcher and any games in progress, wait for the
+        games to finish their teardown
+        """
+        if "_Game__running" not in cls.__dict__:
+            return
+        tasks = list(cls.__running)
+        if "_Game__launcher" in cls.__dict__:
+            tasks.append(cls.__launcher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @classmethod
+    def _launch(cls, *players):
+        task = asyncio.create_task(cls(*players)._start())
+        cls.__running.add(task)
+        task.add_done_callback(cls.__running.discard)
 
     @property
     def player(self):
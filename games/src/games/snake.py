@@ -129,7 +129,7 @@ class Snake(
         f"{cursor.CLEAR}"
         f"{cursor.YELLOW}Make sure to run this game 'real-time' (-i)\n"
         f"See website for details{cursor.RESET}"
-    )
+    ).encode()
     description = "An all ascii take on the classic game of snake."
     game_over = cursor.red("\n\nGAME OVER\n\n")
 
@@ -0,0 +1,27 @@
+import logging
+import logging.handlers
+import queue
+import sys
+
+
+logger = logging.getLogger(__package__)
+
+
+def start_log_listener():
+    """
+    Loggers in this package only put records on a queue, a
+    background thread writes them to stdout so the event loop
+    never blocks on the write.
+
+    Returns the started listener, stop() it to flush on shutdown.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
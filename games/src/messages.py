@@ -27,7 +27,25 @@ TERMNINJA_PROMPT = fr"""
 #
 SUPPORTS_EMOJIS_PROMPT = f"""
 {cursor.blue('Does your terminal support emojis')}\U00002753
-Press enter for yes, enter 'n' for no\n# """
+Press enter for yes, enter 'n' for no\n# """.encode()
+
+
+#
+#   shown once a player is accepted
+#
+PLAYER_PROFILE = (
+    f"\n"
+    f"username:         {{username}}\n"
+    f"score:            {{total_score}}\n"
+    f"token expires in: {{expires_in}}\n"
+    f"\n{cursor.yellow('Press enter to continue...')}"
+)
+
+
+#
+#   clears the screen before queuing for a game
+#
+CLEAR_SCREEN = f"{cursor.CLEAR}{cursor.PAGE_DOWN}{cursor.down(50)}".encode()
 
 
 #
@@ -60,7 +78,7 @@ GENERIC_QUIZ_PROGRESS_UPDATE = (
 GENERIC_QUIZ_CLEAR_ENTRY = (
     f"{cursor.ERASE_LINE}{cursor.up(1)}{cursor.ERASE_LINE}"
     f"{cursor.YELLOW}# {cursor.RESET}"
-)
+).encode()
 
 GENERIC_QUIZ_INTERMISSION_REPORT = (
     f"\n\nCorrect answer: {{correct_answer}}\n"
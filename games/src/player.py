@@ -1,5 +1,10 @@
 import asyncio
 import datetime
+import logging
+import socket
+
+
+logger = logging.getLogger(__name__)
 
 
 anonymous_identity = {
@@ -18,6 +23,39 @@ def format_timedelta(delta):
     return f"{hours:.0f}h {minutes:.0f}m {total_seconds:.0f}s"
 
 
+class PlayerProtocol(asyncio.StreamReaderProtocol, asyncio.BufferedProtocol):
+    """
+    StreamReaderProtocol that lets the transport recv_into a buffer
+    allocated once per connection instead of handing over a new bytes
+    object for every read.
+    """
+
+    buffer_size = 2 ** 16
+    send_buffer_size = 2 ** 18
+
+    def __init__(self, client_connected_cb):
+        super().__init__(asyncio.StreamReader(), client_connected_cb)
+        self._buffer = memoryview(bytearray(self.buffer_size))
+
+    def connection_made(self, transport):
+        sock = transport.get_extra_info('socket')
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            # small interactive writes, don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # room for whole game frames
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size
+            )
+        super().connection_made(transport)
+
+    def get_buffer(self, sizehint):
+        return self._buffer
+
+    def buffer_updated(self, nbytes):
+        # StreamReader copies the slice into its own bytearray
+        self.data_received(self._buffer[:nbytes])
+
+
 class Player:
     """
     Wraps the standard StreamReader, StreamWriter for more
@@ -38,6 +76,7 @@ class Player:
         self.earned = 0
         self.emoji_support = True
         self._play_token_expires_at = None
+        self._address = None
 
     @property
     def play_token_expires_at(self):
@@ -56,22 +95,29 @@ class Player:
 
     @property
     def address(self):
-        addr = self.writer.get_extra_info('peername')
-        return addr[0]
+        # peername is fixed for the life of the connection, look it
+        # up once. it's None if getpeername() failed on accept
+        if self._address is None:
+            peername = self.writer.get_extra_info('peername')
+            self._address = peername and peername[0]
+        return self._address
 
     def assign_db_user(self, user):
         self.total_score = user['total_score']
         self.identity = user
 
-    async def send(self, msg: str):
+    async def send(self, msg):
         """
         encode and send message and wait until
         appropriate to call send again
 
         Args:
-            msg (str): non-encoded message to be sent
+            msg (str or bytes): message to be sent, bytes are
+                assumed to be pre-encoded and sent as is
         """
-        self.writer.write(msg.encode())
+        if isinstance(msg, str):
+            msg = msg.encode()
+        self.writer.write(msg)
         await self.writer.drain()
 
     async def read_raw(self, size, timeout=None):
@@ -191,4 +237,4 @@ class Player:
             pass
         self.writer.close()
         await self.writer.wait_closed()
-        print("[-] connection closed")
+        logger.info("[-] connection closed")
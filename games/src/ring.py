@@ -0,0 +1,76 @@
+import asyncio
+import collections
+
+
+class RingQueue:
+    """
+    Bounded async queue backed by a fixed size ring buffer.
+
+    Meant for many producers handing items to a single consumer on
+    one event loop. Since everything runs on the loop thread, head and
+    tail are plain ints and a waiting consumer is woken with a single
+    future instead of asyncio.Queue's per-item bookkeeping.
+    """
+
+    def __init__(self, maxsize):
+        self._items = [None] * maxsize
+        self._maxsize = maxsize
+        self._head = 0  # next slot to read
+        self._tail = 0  # next slot to write
+        self._getter = None
+        self._putters = collections.deque()
+
+    def qsize(self):
+        return self._tail - self._head
+
+    def full(self):
+        return self.qsize() >= self._maxsize
+
+    def empty(self):
+        return self._head == self._tail
+
+    async def put(self, item):
+        """
+        Add an item, waiting for a free slot if the ring is full
+        """
+        while self.full():
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except asyncio.CancelledError:
+                if putter.done():
+                    # we were handed a slot, pass it on
+                    self._wake_putter()
+                else:
+                    self._putters.remove(putter)
+                raise
+        self._items[self._tail % self._maxsize] = item
+        self._tail += 1
+        if self._getter is not None and not self._getter.done():
+            self._getter.set_result(None)
+
+    async def get(self):
+        """
+        Remove and return an item, waiting until one is available.
+        Only one coroutine may wait in get() at a time.
+        """
+        while self.empty():
+            self._getter = asyncio.get_running_loop().create_future()
+            try:
+                await self._getter
+            finally:
+                self._getter = None
+        idx = self._head % self._maxsize
+        item = self._items[idx]
+        self._items[idx] = None
+        self._head += 1
+        self._wake_putter()
+        return item
+
+    def _wake_putter(self):
+        while self._putters:
+            putter = self._putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+                return
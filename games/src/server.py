@@ -1,15 +1,25 @@
 import asyncio
 import aioredis
 import datetime
-import functools
+import logging
 import signal
+import socket
+import sys
 import os
 import ssl
 import termninja_db as db
+from multiprocessing import Process
 from . import cursor
-from .player import Player
+from .player import Player, PlayerProtocol
 from .reloader import watchdog
-from .messages import TERMNINJA_PROMPT
+from .log import start_log_listener
+from .messages import TERMNINJA_PROMPT, PLAYER_PROFILE
+
+logger = logging.getLogger(__name__)
+
+# wall clock refreshed every second by the running server, close
+# enough for token expiry and per-minute throttling
+_now_cache = [datetime.datetime.now()]
 
 
 class RegisterGamesMixin:
@@ -20,6 +30,9 @@ class RegisterGamesMixin:
     ping_database_interval = 2 * 60  # every 2 minutes
 
     async def on_server_ready(self):
+        if self.worker_id != 0:
+            # every worker serves the same games, register them once
+            return await super().on_server_ready()
         all_games = {
             g.slug: {
                 "name": g.name,
@@ -40,7 +53,7 @@ class ThrottleConnectionsMixin:
     """
 
     REDIS_HOST = os.environ.get("REDIS_HOST", "redis")
-    THROTTLED_MESSAGE = cursor.red("\n\n\t\tTHROTTLED\n\n")
+    THROTTLED_MESSAGE = cursor.red("\n\n\t\tTHROTTLED\n\n").encode()
     MAX_CONNECTIONS_PER_MINUTE = int(os.environ.get("MAX_CONNECTIONS_PER_MINUTE", 5))
 
     async def initialize(self):
@@ -50,8 +63,7 @@ class ThrottleConnectionsMixin:
         return await super().initialize()
 
     def make_key_for(self, player):
-        now = datetime.datetime.now()
-        return f"{player.address}:{now.minute}"
+        return f"{player.address}:{_now_cache[0].minute}"
 
     async def should_accept_player(self, player):
         key = self.make_key_for(player)
@@ -68,6 +80,7 @@ class ThrottleConnectionsMixin:
     async def teardown(self):
         self.redis.close()
         await self.redis.wait_closed()
+        return await super().teardown()
 
 
 class SSLMixin:
@@ -109,23 +122,27 @@ class OptionalAuthenticationMixin:
         f"{cursor.move_to_column(len(enter_token_prompt))}"
         f"{cursor.ERASE_TO_LINE_END}"
     )
-    token_accepted_message = f"{erase_input}{cursor.green(' accepted')}\n"
-    token_rejected_message = f"{erase_input}{cursor.red(' rejected')}\n"
-    token_expired_message = f"{erase_input}{cursor.red(' token expired')}\n"
+
+    # sent to every connection, encode once
+    enter_token_message = enter_token_prompt.encode()
+    piped_token_message = f"{enter_token_prompt}\n".encode()
+    token_accepted_message = f"{erase_input}{cursor.green(' accepted')}\n".encode()
+    token_rejected_message = f"{erase_input}{cursor.red(' rejected')}\n".encode()
+    token_expired_message = f"{erase_input}{cursor.red(' token expired')}\n".encode()
 
     @staticmethod
     def token_is_expired(expiration_datetime):
-        return expiration_datetime < datetime.datetime.now()
+        return expiration_datetime < _now_cache[0]
 
     async def should_accept_player(self, player):
         try:
             # allow the token to be piped to stdin on ncat call
             # e.g. with termninja client script -t
             token = await player.readline(timeout=0.1)
-            await player.send(f"{self.enter_token_prompt}\n")
+            await player.send(self.piped_token_message)
         except asyncio.TimeoutError:
             # user must enter the token interactively
-            await player.send(self.enter_token_prompt)
+            await player.send(self.enter_token_message)
             token = await player.readline()
 
         # play anonymously
@@ -162,36 +179,48 @@ class OptionalAuthenticationMixin:
         return False
 
     async def on_player_accepted(self, player):
+        green = cursor.green
         await player.send(
-            f"\n"
-            f"username:         {cursor.green(player.username)}\n"
-            f"score:            {cursor.green(player.total_score)}\n"
-            f"token expires in: {cursor.green(player.play_token_expires_at)}\n"
-            f"\n{cursor.yellow('Press enter to continue...')}"
+            PLAYER_PROFILE.format(
+                username=green(player.username),
+                total_score=green(player.total_score),
+                expires_in=green(player.play_token_expires_at),
+            )
         )
         await player.readline()
         return await super().on_player_accepted(player)
 
 
 class BaseServer:
+    backlog = 4096  # pending connections the kernel will hold
+
     def __init__(self):
         self.games = []
         self._prompt = None
+        self._connections = set()
+        self.worker_id = 0
 
     def add_game(self, game_class):
         self.games.append(game_class)
 
-    def start(self, debug=True, **kwargs):
+    def start(self, debug=True, workers=1, **kwargs):
+        """
+        debug runs the server under the reloader. asyncio's debug mode
+        slows down every task, it's only turned on with TERMNINJA_DEBUG=1
+        """
+        asyncio_debug = os.environ.get("TERMNINJA_DEBUG") == "1"
         if debug and os.environ.get("TERMNINJA_SERVER_RUNNING") != "true":
             watchdog(2)
+        elif workers > 1:
+            self._start_workers(workers, asyncio_debug, **kwargs)
         else:
-            asyncio.run(self._start_serving(**kwargs), debug=debug)
+            asyncio.run(self._start_serving(**kwargs), debug=asyncio_debug)
 
     async def on_player_connected(self, player):
         """
         first hook opportunity for a connection to the server
         """
-        print(f"[+] connection from {player.address}")
+        logger.info("[+] connection from %s", player.address)
 
     async def should_accept_player(self, player):
         """
@@ -212,8 +241,12 @@ class BaseServer:
         pass
 
     async def start_async_server(self, **kwargs):
-        return await asyncio.start_server(
-            self._on_connection, reuse_port=True, **kwargs
+        loop = asyncio.get_running_loop()
+        return await loop.create_server(
+            lambda: PlayerProtocol(self._on_connection),
+            reuse_port=hasattr(socket, "SO_REUSEPORT"),
+            backlog=self.backlog,
+            **kwargs,
         )
 
     async def get_game_choice(self, player):
@@ -247,26 +280,81 @@ class BaseServer:
         return TERMNINJA_PROMPT.format(game_choices)
 
     async def initialize(self):
+        self._log_listener = start_log_listener()
+        self._stop_event = asyncio.Event()
+        self._tick_clock()
         self._register_signal_handlers()
-        self._prompt = self.make_game_prompt()
+        self._prompt = self.make_game_prompt().encode()
         await db.conn.connect()
 
     async def teardown(self):
+        self._clock_handle.cancel()
         await db.conn.disconnect()
+        self._log_listener.stop()
+
+    def _tick_clock(self):
+        _now_cache[0] = datetime.datetime.now()
+        loop = asyncio.get_running_loop()
+        self._clock_handle = loop.call_later(1, self._tick_clock)
+
+    def _start_workers(self, workers, debug, **kwargs):
+        """
+        Serve from several processes. Each one binds the same port
+        with SO_REUSEPORT and the kernel spreads connections across them.
+        """
+        if not hasattr(socket, "SO_REUSEPORT"):
+            raise RuntimeError(
+                "multiple workers need SO_REUSEPORT, which this platform "
+                "doesn't support. Run with workers=1"
+            )
+        processes = [
+            Process(target=self._run_worker, args=(worker_id, debug), kwargs=kwargs)
+            for worker_id in range(workers)
+        ]
+        for process in processes:
+            process.start()
+
+        def stop_workers(*args):
+            for process in processes:
+                process.terminate()
+
+        signal.signal(signal.SIGINT, stop_workers)
+        signal.signal(signal.SIGTERM, stop_workers)
+        for worker_id, process in enumerate(processes):
+            process.join()
+            if process.exitcode != 0:
+                logger.error(
+                    "[-] worker %s exited with code %s", worker_id, process.exitcode
+                )
+
+    def _run_worker(self, worker_id, debug, **kwargs):
+        self.worker_id = worker_id
+        asyncio.run(self._start_serving(**kwargs), debug=debug)
 
     def _register_signal_handlers(self):
         """
         Register handlers in the event loop for stop signals
         """
         loop = asyncio.get_running_loop()
-        for signame in {"SIGINT", "SIGTERM"}:
-            loop.add_signal_handler(
-                getattr(signal, signame), functools.partial(self._handle_stop_signal)
-            )
-
-    def _handle_stop_signal(self):
-        for task in asyncio.Task.all_tasks():
-            task.cancel()
+        for signo in (signal.SIGINT, signal.SIGTERM):
+            if sys.platform == "win32":
+                # the windows loops don't support add_signal_handler
+                signal.signal(
+                    signo,
+                    lambda signo, frame: loop.call_soon_threadsafe(
+                        self._handle_stop_signal, signo
+                    ),
+                )
+            else:
+                loop.add_signal_handler(signo, self._handle_stop_signal, signo)
+
+    def _handle_stop_signal(self, signo):
+        """
+        Let _start_serving observe the stop instead of cancelling
+        every task in the loop from here
+        """
+        logger.info("[-] received %s, stopping", signal.Signals(signo).name)
+        self._stop_event.set()
 
     def _validate_choice(self, raw_choice):
         try:
@@ -281,25 +369,53 @@ class BaseServer:
         await self.initialize()
         await self.on_server_ready()
         server = await self.start_async_server(**kwargs)
-        async with server:
-            try:
-                print("Server starting...")
-                await server.serve_forever()
-            except asyncio.CancelledError:
-                await self.teardown()
-
-    async def _on_connection(self, reader, writer):
+        logger.info("Server starting...")
+        await self._stop_event.wait()
+        server.close()
+        await self._cancel_connections()
+        await self._cancel_games()
+        await self.teardown()
+
+    async def _cancel_connections(self):
+        """
+        Cancel connections still in the handshake and wait for them
+        to unwind, so teardown doesn't pull the database out from
+        under them
+        """
+        for task in self._connections:
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def _cancel_games(self):
+        """
+        Cancel games in progress while the database is still connected
+        so they can store the rounds played
+        """
+        await asyncio.gather(*[game.cancel_running() for game in self.games])
+
+    def _on_connection(self, reader, writer):
+        """
+        accept callback, run the handshake in its own task and
+        return right away
+        """
+        task = asyncio.create_task(self._handle_connection(Player(reader, writer)))
+        self._connections.add(task)
+        task.add_done_callback(self._connections.discard)
+
+    async def _handle_connection(self, player):
         """
         figure out what game they want to play and send them to the
         appropriate manager for that game
         """
-        player = Player(reader, writer)
         try:
             await self._accept_player(player)
             choice = await self.get_game_choice(player)
             await self.games[choice].player_connected(player)
         except (ConnectionResetError, ConnectionRefusedError):
             await player.close()
+        except asyncio.CancelledError:
+            await player.close()
+            raise
 
     async def _accept_player(self, player):
         """